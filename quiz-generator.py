@@ -1,6 +1,7 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import time
-import json
+import orjson
 import os
 import random
 from datetime import datetime
@@ -8,12 +9,20 @@ from datetime import datetime
 # Load questions from JSON files
 QUESTION_PATH = "questions/"
 
-# Function to load questions from a JSON file
-def load_questions(subject, subsection):
-    file_path = os.path.join(QUESTION_PATH, f"{subject}_{subsection}.json")
+# Function to get the JSON file path for a subject/subsection
+def question_file(subject, subsection):
+    return os.path.join(QUESTION_PATH, f"{subject}_{subsection}.json")
+
+# Function to load questions from a JSON file (mtime is part of the cache key,
+# so an edited file is re-read while unchanged ones are parsed only once).
+# Cached as a resource so all sessions share one read-only list instead of
+# each quiz start unpickling a private copy of the whole bank.
+@st.cache_resource(max_entries=256, show_spinner=False)
+def load_questions(subject, subsection, mtime):
+    file_path = question_file(subject, subsection)
     if os.path.exists(file_path):
-        with open(file_path, "r") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
     return []
 
 # UPSC Subjects and their subsections
@@ -28,8 +37,55 @@ UPSC_SUBJECTS = {
 
 # Function to get random questions
 def get_random_questions(subject, subsection, num_questions=25):
-    questions = load_questions(subject, subsection)
-    return random.sample(questions, min(num_questions, len(questions)))
+    file_path = question_file(subject, subsection)
+    mtime = os.path.getmtime(file_path) if os.path.exists(file_path) else None
+    questions = load_questions(subject, subsection, mtime)
+    picked = random.sample(range(len(questions)), min(num_questions, len(questions)))
+    return [dict(questions[i]) for i in picked]
+
+# Callback for the submit button, runs before the rerun so the answers render locked
+def submit_quiz():
+    st.session_state["submitted"] = True
+
+# Countdown timer that ticks in the browser, so the server does no work until the next interaction
+def show_timer():
+    remaining_ms = max(0, int((st.session_state["end_time"] - time.time()) * 1000))
+    components.html(f"""
+        <div id="timer" style="font-family: 'Source Sans Pro', sans-serif;"></div>
+        <script>
+            const end = Date.now() + {remaining_ms};
+            const timer = document.getElementById("timer");
+            const pad = (n) => String(n).padStart(2, "0");
+            const tick = () => {{
+                const seconds = Math.ceil(Math.max(0, end - Date.now()) / 1000);
+                timer.textContent = seconds > 0
+                    ? `⏳ Time Remaining: ${{pad(Math.floor(seconds / 60))}}:${{pad(seconds % 60)}}`
+                    : "⏳ Time's Up! Submit the quiz to see your results.";
+                if (seconds <= 0) clearInterval(interval);
+            }};
+            const interval = setInterval(tick, 250);
+            tick();
+        </script>
+    """, height=30)
+
+# Function to render the questions of the active quiz and return the selected answers
+def render_questions(questions):
+    question_keys = st.session_state["question_keys"]
+    responses = [None] * len(questions)
+    
+    st.write("### 📖 Answer the following UPSC-level questions:")
+    
+    for index, q in enumerate(questions):
+        with st.container():
+            st.markdown(f"**{index + 1}. {q['question']}**")
+            responses[index] = st.radio(
+                "",
+                q["_labels"],
+                index=None,
+                key=question_keys[index],
+                disabled=st.session_state["submitted"]
+            )
+    return responses
 
 def conduct_quiz():
     """Runs a UPSC quiz with pre-stored questions in JSON files."""
@@ -49,66 +105,67 @@ def conduct_quiz():
             st.warning("⚠️ No questions available for this subsection. Please try another.")
             return
         
-        total_time = num_questions * 15
-        start_time = time.time()
-        end_time = start_time + total_time
-        st.session_state["submitted"] = False
-        
-        timer_placeholder = st.empty()
-        responses = {}
-        
-        st.write("### 📖 Answer the following UPSC-level questions:")
-        
-        for index, q in enumerate(questions, start=1):
-            with st.container():
-                st.markdown(f"**{index}. {q['question']}**")
-                responses[f"q{index}"] = st.radio(
-                    "",
-                    [f"{chr(65 + i)}. {option}" for i, option in enumerate(q['options'])],
-                    index=None,
-                    key=f"q{index}",
-                    disabled=st.session_state["submitted"]
-                )
+        # Build the option labels once here instead of on every rerun of the quiz page
+        for q in questions:
+            q["_labels"] = [f"{chr(65 + i)}. {option}" for i, option in enumerate(q['options'])]
         
-        if not st.session_state["submitted"]:
-            submit_clicked = st.button("✅ Submit Quiz")
-            
-            while time.time() < end_time and not st.session_state["submitted"]:
-                remaining_time = int(end_time - time.time())
-                minutes, seconds = divmod(remaining_time, 60)
-                timer_placeholder.markdown(f"⏳ Time Remaining: {minutes:02}:{seconds:02}")
-                time.sleep(1)
-                if submit_clicked:
-                    st.session_state["submitted"] = True
-                    break
-            
-            if time.time() >= end_time and not st.session_state["submitted"]:
-                st.warning("⏳ Time's Up! Auto-submitting your answers.")
-                time.sleep(2)
-                st.session_state["submitted"] = True
+        # Keep the quiz in session_state so it survives the reruns triggered by answering
+        total_time = num_questions * 15
+        for key in st.session_state.get("question_keys", []):
+            st.session_state.pop(key, None)
+        st.session_state.update(
+            quiz_active=True,
+            questions=questions,
+            question_keys=[f"q{index}" for index in range(1, len(questions) + 1)],
+            end_time=time.time() + total_time,
+            submitted=False,
+        )
+    
+    if not st.session_state.get("quiz_active"):
+        return
+    questions = st.session_state["questions"]
+    
+    if not st.session_state["submitted"] and time.time() >= st.session_state["end_time"]:
+        st.warning("⏳ Time's Up! Auto-submitting your answers.")
+        st.session_state["submitted"] = True
+    
+    if not st.session_state["submitted"]:
+        show_timer()
+    responses = render_questions(questions)
+    
+    if not st.session_state["submitted"]:
+        st.button("✅ Submit Quiz", on_click=submit_quiz)
+    
+    if st.session_state["submitted"]:
+        score = 0
+        results = []
         
-        if st.session_state["submitted"]:
-            score = 0
-            st.write("### 📊 Quiz Results")
+        # Score everything first, then render the results as a single table
+        for index, (q, answer) in enumerate(zip(questions, responses), start=1):
+            correct_option = q['answer']
             
-            for index, q in enumerate(questions, start=1):
-                answer = responses[f"q{index}"]
-                correct_option = q['answer']
-                
-                if answer:
-                    selected_option = answer[0]
-                    if selected_option == correct_option:
-                        score += 2
-                        st.success(f"✅ {index}. {q['question']} (Correct!)")
-                    else:
-                        score -= 0.66
-                        st.error(f"❌ {index}. {q['question']} (Wrong!)")
-                        st.write(f"✔️ Correct Answer: {correct_option}")
+            if answer:
+                selected_option = answer[0]
+                if selected_option == correct_option:
+                    marks, result = 2, "✅ Correct"
                 else:
-                    st.warning(f"⚠️ {index}. {q['question']} (Unanswered)")
-                    st.write(f"✔️ Correct Answer: {correct_option}")
+                    marks, result = -0.66, "❌ Wrong"
+            else:
+                selected_option, marks, result = "", 0, "⚠️ Unanswered"
             
-            st.write(f"### 🎯 {player_name}, your final score is: **{score}/{num_questions * 2}**")
+            score += marks
+            results.append({
+                "#": index,
+                "Question": q['question'],
+                "Your Answer": selected_option,
+                "Correct Answer": correct_option,
+                "Result": result,
+                "Marks": marks,
+            })
+        
+        st.write("### 📊 Quiz Results")
+        st.metric(f"🎯 {player_name}, your final score is:", f"{round(score, 2)}/{num_questions * 2}")
+        st.dataframe(results, hide_index=True)
             
 if __name__ == "__main__":
     conduct_quiz()